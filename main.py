@@ -8,13 +8,17 @@
 # ===================================================================================
 
 import json
+import multiprocessing
 import os
+import queue
 import subprocess
 import sys
 import threading
 import time
+import uuid
 import winreg
-from collections import defaultdict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from tkinter import (
     BOTH,
@@ -31,11 +35,11 @@ from tkinter import (
 )
 
 # --- 3rd Party Libraries ---
+import pikepdf
 import pystray
 import requests
 from packaging.version import parse as parse_version
 from PIL import Image
-from pypdf import PdfReader, PdfWriter
 from pystray import MenuItem as item
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
@@ -90,6 +94,7 @@ GITHUB_REPO = "jindalshreyansh/letterhead-merger"
 CONFIG_FILE = Path.home() / f".{APP_NAME.lower().replace(' ', '_')}_config.json"
 ICON_PATH = resource_path("icon.ico")
 DEBOUNCE_SECONDS = 10
+MAX_LOG_LINES = 500
 
 # A unique name for the Mutex. A GUID is used to ensure it's globally unique.
 MUTEX_NAME = "PDFLetterheadMerger_Mutex_9D4F1A2E-2E8A-4B6F-B2E2-7B4A2D8F0A1E"
@@ -108,41 +113,76 @@ def load_config():
 
 
 def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
+    tmp_path = CONFIG_FILE.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
         json.dump(config, f, indent=4)
+    os.replace(tmp_path, CONFIG_FILE)
 
 
 config = load_config()
 
 
+# Pending log lines; deque appends are thread-safe, so any thread can log
+# and the app's 100 ms after-tick flushes the batch on the Tk main thread.
+_log_queue = deque()
+
+
 def log_message(text_widget, message):
     if not text_widget:
         return
-    text_widget.config(state="normal")
-    text_widget.insert(END, f"{time.strftime('%H:%M:%S')} - {message}\n")
-    text_widget.see(END)
-    text_widget.config(state="disabled")
+    _log_queue.append(f"{time.strftime('%H:%M:%S')} - {message}\n")
 
 
 def has_letterhead_applied(pdf_path: Path) -> bool:
     try:
-        reader = PdfReader(pdf_path)
-        meta = reader.metadata
-        if meta and meta.producer and meta.producer.strip().startswith(APP_NAME):
-            return True
+        with pikepdf.open(str(pdf_path)) as pdf:
+            producer = str(pdf.docinfo.get("/Producer", ""))
+            if producer.strip().startswith(APP_NAME):
+                return True
     except Exception as e:
         # Handle corrupt or unreadable PDFs gracefully
         print(f"[!] Could not read metadata for {pdf_path.name}: {e}")
     return False
 
 
+def _overlay_letterhead(pdf, header_page):
+    """Stamp header_page onto every page of pdf and set the producer tag.
+
+    The letterhead is copied into pdf exactly once as a form XObject; each
+    page's overlay is an indirect reference to that single object, so CPU
+    and output size stay flat no matter how many pages the invoice has.
+
+    Memory stays bounded too: qpdf lazily loads objects from the source and
+    streams them out page by page on save, so there is no whole-document
+    writer buffer in Python (pypdf's PdfWriter held every page in RAM,
+    which is why very long invoices used to blow up memory).
+    """
+    header_xobj = pdf.copy_foreign(header_page.as_form_xobject())
+    for page in pdf.pages:
+        page.add_overlay(header_xobj)
+    pdf.docinfo["/Producer"] = f"{APP_NAME} v{__version__}"
+
+
 def merge_letterhead(
     app_instance,
     invoice_path: Path,
-    letterhead_path: Path,
-    output_path: Path = None,
+    header_page,
+    output_path: Path,
     retries: int = 3,
+    durability: bool = False,
 ):
+    """Merge header_page onto invoice_path and save to output_path.
+
+    Used by the manual-merge path; watch mode merges in place via
+    _merge_server, which owns the hidden-temp-file + os.replace protocol.
+
+    Durability policy: the merged PDF is fully reproducible from the source
+    invoice + letterhead, so by default we leave flushing to the OS page
+    cache — no flush()/os.fsync() on the output. A manual fsync would stall
+    throughput on slow disks for zero recovery benefit. Anyone who genuinely
+    needs a synced write must pass durability=True rather than adding an
+    unconditional fsync here.
+    """
     log_widget = app_instance.log_text
 
     # The only check needed at the start is the metadata stamp.
@@ -153,38 +193,26 @@ def merge_letterhead(
         return
 
     try:
-        # The global 'processed_files' set and '.merged.pdf' filename check are now removed.
-        invoice = PdfReader(str(invoice_path))
-        letterhead = PdfReader(str(letterhead_path))
-        if len(letterhead.pages) != 1:
-            raise ValueError("Letterhead PDF must have exactly one page.")
-
-        header_page = letterhead.pages[0]
-        writer = PdfWriter()
-        for page in invoice.pages:
-            merged_page = page
-            merged_page.merge_page(header_page)
-            writer.add_page(merged_page)
-
-        writer.add_metadata({"/Producer": f"{APP_NAME} v{__version__}"})
-
-        temp_path = (
-            output_path if output_path else invoice_path.with_suffix(".merged.pdf")
-        )
-
         for _ in range(retries):
             try:
-                with open(temp_path, "wb") as f:
-                    writer.write(f)
-                if output_path is None:
-                    os.replace(temp_path, invoice_path)
-                    msg = f"Merged: {invoice_path.name}"
-                    log_message(log_widget, f"[✓] {msg}")
-                    app_instance.notify("Merge Complete", msg)
-                else:
-                    msg = f"Merged file saved:\n{temp_path}"
-                    log_message(log_widget, f"[✓] Manual Merge Saved: {temp_path.name}")
-                    messagebox.showinfo("Success", msg)
+                with pikepdf.open(str(invoice_path)) as pdf:
+                    _overlay_letterhead(pdf, header_page)
+                    pdf.save(
+                        str(output_path), linearize=False, compress_streams=True
+                    )
+                if durability:
+                    fd = os.open(str(output_path), os.O_RDWR)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                msg = f"Merged file saved:\n{output_path}"
+                log_message(log_widget, f"[✓] Manual Merge Saved: {output_path.name}")
+                # Tk calls must happen on the main thread; this may run on
+                # a worker thread.
+                app_instance.root.after(
+                    0, lambda: messagebox.showinfo("Success", msg)
+                )
                 return
             except PermissionError:
                 time.sleep(1.5)
@@ -193,45 +221,165 @@ def merge_letterhead(
         error_msg = f"Merge failed for {invoice_path.name}: {e}"
         app_instance.notify("Merge Failed", str(error_msg))
         log_message(log_widget, f"[✗] {error_msg}")
-        if output_path:
-            messagebox.showerror("Merge Error", str(e))
+        err = str(e)
+        app_instance.root.after(
+            0, lambda: messagebox.showerror("Merge Error", err)
+        )
+
+
+def _merge_worker(invoice_path: str, letterhead_path: str, out_path: str):
+    """Merge a single invoice in a worker process. Returns (ok, message).
+
+    Takes and returns only picklable values so it can be dispatched through
+    a ProcessPoolExecutor from batch_merge.
+    """
+    name = Path(invoice_path).name
+    try:
+        if has_letterhead_applied(Path(invoice_path)):
+            return True, f"Skipped (already has letterhead): {name}"
+        with pikepdf.open(letterhead_path) as letterhead:
+            if len(letterhead.pages) != 1:
+                raise ValueError("Letterhead PDF must have exactly one page.")
+            header_page = letterhead.pages[0]
+            # Retry transient locks (AV scanner, Explorer preview) on the
+            # input or output, matching merge_letterhead's behavior.
+            for _ in range(3):
+                try:
+                    with pikepdf.open(
+                        invoice_path, allow_overwriting_input=True
+                    ) as pdf:
+                        _overlay_letterhead(pdf, header_page)
+                        pdf.save(out_path, linearize=False, compress_streams=True)
+                    return True, f"Merged: {name}"
+                except PermissionError:
+                    time.sleep(1.5)
+        raise Exception("Could not save file after multiple retries.")
+    except Exception as e:
+        return False, f"Merge failed for {name}: {e}"
+
+
+def _merge_server(task_q, result_q, letterhead_path: str):
+    """Long-lived merge worker process for the watch workflow.
+
+    Loads pikepdf and parses the letterhead exactly once, then merges every
+    invoice path received on task_q in place, reporting (ok, message) tuples
+    on result_q. A None task shuts the server down. This amortizes library
+    init and letterhead parsing over the lifetime of the app instead of
+    paying them per file.
+    """
+    try:
+        letterhead = pikepdf.open(letterhead_path)
+        if len(letterhead.pages) != 1:
+            raise ValueError("Letterhead PDF must have exactly one page.")
+        header_page = letterhead.pages[0]
+    except Exception as e:
+        result_q.put((False, f"Could not load letterhead: {e}"))
+        return
+    while True:
+        invoice_path = task_q.get()
+        if invoice_path is None:
+            break
+        name = Path(invoice_path).name
+        try:
+            if has_letterhead_applied(Path(invoice_path)):
+                result_q.put((True, f"Skipped (already has letterhead): {name}"))
+                continue
+            # In-place merge protocol: write to a hidden same-directory temp
+            # file and atomically rename over the source. The .tmp- prefix is
+            # ignored by _process_event, so the watcher never sees the
+            # intermediate file (pikepdf's own overwrite temp would emit
+            # .pdf events).
+            temp_path = str(
+                Path(invoice_path).with_name(
+                    f".tmp-{os.getpid()}-{uuid.uuid4().hex}.pdf"
+                )
+            )
+            # Freshly written files are often held briefly by AV scanners or
+            # Explorer on Windows, so transient PermissionErrors get retried
+            # just like merge_letterhead does.
+            for _ in range(3):
+                try:
+                    with pikepdf.open(invoice_path) as pdf:
+                        _overlay_letterhead(pdf, header_page)
+                        pdf.save(temp_path, linearize=False, compress_streams=True)
+                    os.replace(temp_path, invoice_path)
+                    result_q.put((True, f"Merged: {name}"))
+                    break
+                except PermissionError:
+                    time.sleep(1.5)
+            else:
+                raise Exception("Could not save file after multiple retries.")
+        except Exception as e:
+            result_q.put((False, f"Merge failed for {name}: {e}"))
 
 
 def wait_until_file_ready(file_path: Path, timeout=10):
-    last_size = -1
-    for _ in range(timeout * 2):
-        if not file_path.exists():
-            time.sleep(0.5)
-            continue
+    """Return True once file_path can be opened and its size is stable.
+
+    Fast path: one open-for-read plus two stats 50 ms apart, so files that
+    have already settled are ready in under 100 ms instead of the old
+    500 ms-per-poll loop. Only while the file is still locked or being
+    written do we retry, backing off exponentially from 50 ms to 1 s until
+    timeout seconds have passed.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
         try:
-            current_size = file_path.stat().st_size
-            if current_size == last_size and current_size > 0:
-                return True
-            last_size = current_size
-        except FileNotFoundError:
+            with open(file_path, "rb"):
+                pass
+            size = file_path.stat().st_size
+            if size > 0:
+                time.sleep(0.05)
+                if file_path.stat().st_size == size:
+                    return True
+        except OSError:
+            # Missing, locked, or mid-write — fall through and retry.
+            pass
+        if time.monotonic() >= deadline:
             return False
-        time.sleep(0.5)
-    return False
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
 
 
 class InvoiceHandler(FileSystemEventHandler):
-    def __init__(self, app_instance, letterhead_path):
+    # Cap on the dedupe map so a long-running watch session can't grow it
+    # without bound; oldest entries are evicted first.
+    MAX_TRACKED_FILES = 1024
+
+    def __init__(self, app_instance):
         self.app = app_instance
-        self.letterhead_path = letterhead_path
-        self.processed_files = defaultdict(float)
+        self.processed_files = OrderedDict()
         self.start_time = time.time()
-
-    def _should_process(self, file_path: Path) -> bool:
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+    def stop(self):
+        with self._pending_lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._pending.clear()
+        self._pool.shutdown(wait=False)
+
+    def _should_process(self, path_str: str) -> bool:
         now = time.time()
         try:
-            if file_path.stat().st_mtime < self.start_time:
+            if os.stat(path_str).st_mtime < self.start_time:
                 return False
-        except FileNotFoundError:
+        except OSError:
             return False
-        file_key = str(file_path.resolve())
+        # normcase+abspath is a pure string transform — no extra syscalls,
+        # unlike Path.resolve() which hits the filesystem per event.
+        file_key = os.path.normcase(os.path.abspath(path_str))
         if now - self.processed_files.get(file_key, 0) < DEBOUNCE_SECONDS:
             return False
         self.processed_files[file_key] = now
+        self.processed_files.move_to_end(file_key)
+        while len(self.processed_files) > self.MAX_TRACKED_FILES:
+            self.processed_files.popitem(last=False)
         return True
 
     def _handle_pdf(self, file_path: Path):
@@ -240,18 +388,55 @@ class InvoiceHandler(FileSystemEventHandler):
                 self.app.log_text, f"[!] File never stabilized: {file_path.name}"
             )
             return
-        merge_letterhead(self.app, file_path, self.letterhead_path)
+        self.app.submit_merge(str(file_path))
+
+    def _flush_pending(self):
+        """Drain pending paths that have been quiet for DEBOUNCE_SECONDS."""
+        now = time.time()
+        with self._pending_lock:
+            ready = [
+                path
+                for path, seen in self._pending.items()
+                if now - seen >= DEBOUNCE_SECONDS
+            ]
+            for path in ready:
+                del self._pending[path]
+            if self._pending:
+                # Re-arm for when the oldest still-pending entry becomes due,
+                # not a full DEBOUNCE_SECONDS — otherwise a file whose events
+                # stop just after a flush waits up to twice the window.
+                oldest = min(self._pending.values())
+                delay = max(DEBOUNCE_SECONDS - (now - oldest), 0.1)
+                self._flush_timer = threading.Timer(delay, self._flush_pending)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            else:
+                self._flush_timer = None
+        for path in ready:
+            # Only materialize a Path for events that will actually be merged.
+            if self._should_process(path):
+                self._pool.submit(self._handle_pdf, Path(path))
 
     def _process_event(self, event):
+        if event.is_directory:
+            return
+        name = os.path.basename(event.src_path).lower()
         if (
-            event.is_directory
-            or not event.src_path.lower().endswith((".pdf"))
-            or event.src_path.lower().endswith(".merged.pdf")
+            not name.endswith(".pdf")
+            or name.endswith(".merged.pdf")
+            or name.startswith(".tmp-")
         ):
             return
-        file_path = Path(event.src_path)
-        if self._should_process(file_path):
-            self._handle_pdf(file_path)
+        # Coalesce the created+modified bursts every save produces: just
+        # note the path and let one timer flush the batch once it's quiet.
+        with self._pending_lock:
+            self._pending[event.src_path] = time.time()
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    DEBOUNCE_SECONDS, self._flush_pending
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
     def on_created(self, event):
         self._process_event(event)
@@ -282,6 +467,7 @@ class PDFMergerApp:
         self.root = root
         self.icon = None
         self.observer = None
+        self.watch_handler = None
         self.root.title(f"{APP_NAME} v{__version__}")
         self.root.geometry("550x550")
         self.root.minsize(500, 500)
@@ -289,9 +475,24 @@ class PDFMergerApp:
             self.root.iconbitmap(ICON_PATH)
         except Exception:
             print(f"[!] Could not find or load window icon from path: {ICON_PATH}")
+        # Decode the tray icon once; minimizing to tray shouldn't reopen and
+        # reparse the ICO file every time.
+        try:
+            self._tray_image = Image.open(ICON_PATH).copy()
+            self._tray_image.load()
+        except Exception as e:
+            print(f"[!] Could not load tray icon from {ICON_PATH}: {e}")
+            self._tray_image = Image.new("RGB", (64, 64), "white")
         self.letterhead_path = StringVar(value=config.get("letterhead_path", ""))
         self.watch_folder = StringVar(value=config.get("watch_folder", ""))
         self.status_text = StringVar()
+        self._config_save_timer = None
+        self._config_save_lock = threading.Lock()
+        # Persistent watch-mode merge worker — see _start_merge_server().
+        self._merger = None
+        self._merge_q = None
+        self._result_q = None
+        self._result_poller_running = False
 
         self.setup_styles()
         self.create_widgets()
@@ -304,6 +505,113 @@ class PDFMergerApp:
         if self.letterhead_path.get() and self.watch_folder.get():
             self.toggle_watch()
         threading.Thread(target=self.check_for_updates, daemon=True).start()
+        self.root.after(100, self._flush_log)
+
+    def _flush_log(self):
+        """Flush queued log lines into the Text widget in one insert.
+
+        Coalescing bursts into a single insert and trimming the widget to
+        the last MAX_LOG_LINES lines keeps logging O(1) during long watch
+        sessions instead of letting Tk redraw an ever-growing buffer.
+        """
+        if _log_queue:
+            lines = []
+            while _log_queue:
+                try:
+                    lines.append(_log_queue.popleft())
+                except IndexError:
+                    break
+            self.log_text.config(state="normal")
+            self.log_text.insert(END, "".join(lines))
+            total = int(self.log_text.index("end-1c").split(".")[0])
+            if total > MAX_LOG_LINES:
+                self.log_text.delete("1.0", f"{total - MAX_LOG_LINES}.0")
+            self.log_text.see(END)
+            self.log_text.config(state="disabled")
+        self.root.after(100, self._flush_log)
+
+    def _start_merge_server(self):
+        """Spawn the persistent merge worker process for watch mode.
+
+        The worker holds the parsed letterhead for its whole lifetime, so
+        each watched file only pays for its own merge. Results are drained
+        into the log by a root.after poller.
+        """
+        if self._merger and self._merger.is_alive():
+            return
+        self._merge_q = multiprocessing.Queue()
+        self._result_q = multiprocessing.Queue()
+        self._merger = multiprocessing.Process(
+            target=_merge_server,
+            args=(self._merge_q, self._result_q, self.letterhead_path.get()),
+            daemon=True,
+        )
+        self._merger.start()
+        # Only ever run one poll chain; a restart (e.g. new letterhead while
+        # watching) must not stack another 10 Hz callback on top of the old
+        # one, which keeps itself alive as long as any worker is running.
+        if not self._result_poller_running:
+            self._result_poller_running = True
+            self.root.after(100, self._poll_merge_results)
+
+    def _stop_merge_server(self):
+        if self._merger and self._merger.is_alive():
+            self._merge_q.put(None)
+            self._merger.join(timeout=2)
+        self._merger = None
+
+    def submit_merge(self, invoice_path: str):
+        if self._merger is None or not self._merger.is_alive():
+            # The worker died (e.g. its letterhead failed to load); don't
+            # enqueue into a queue nobody reads.
+            msg = f"Merge worker is not running; skipped: {Path(invoice_path).name}"
+            log_message(self.log_text, f"[✗] {msg}")
+            self.notify("Merge Failed", msg)
+            return
+        self._merge_q.put(invoice_path)
+
+    def _poll_merge_results(self):
+        # Snapshot liveness before draining: when the worker has just died,
+        # this pass is the final drain, so results already in the pipe are
+        # logged before the poll chain is abandoned.
+        alive = self._merger is not None and self._merger.is_alive()
+        try:
+            while True:
+                ok, msg = self._result_q.get_nowait()
+                log_message(self.log_text, f"[✓] {msg}" if ok else f"[✗] {msg}")
+                if not ok:
+                    self.notify("Merge Failed", msg)
+                elif msg.startswith("Merged"):
+                    self.notify("Merge Complete", msg)
+        except queue.Empty:
+            pass
+        if alive:
+            self.root.after(100, self._poll_merge_results)
+        else:
+            self._result_poller_running = False
+
+    def _schedule_config_save(self):
+        """Coalesce config writes: changes within 500 ms produce one write.
+
+        Keeps the UI callbacks from blocking on a synchronous JSON write,
+        which matters on slow or roaming home directories.
+        """
+        with self._config_save_lock:
+            if self._config_save_timer:
+                self._config_save_timer.cancel()
+            self._config_save_timer = threading.Timer(0.5, self._flush_config)
+            self._config_save_timer.daemon = True
+            self._config_save_timer.start()
+
+    def _flush_config(self):
+        with self._config_save_lock:
+            if self._config_save_timer:
+                self._config_save_timer.cancel()
+                self._config_save_timer = None
+            try:
+                save_config(config)
+            except OSError as e:
+                print(f"[!] Could not save config: {e}")
 
     def validate_paths_on_startup(self):
         """Checks if configured paths exist. If not, clears them and notifies the user."""
@@ -384,9 +692,10 @@ class PDFMergerApp:
         ttk.Button(
             btn_frame, text="📎 Manual Merge Single PDF", command=self.manual_merge
         ).grid(row=0, column=0, padx=5, sticky="ew")
-        ttk.Button(
+        self.batch_btn = ttk.Button(
             btn_frame, text="📚 Batch Merge Multiple PDFs", command=self.batch_merge
-        ).grid(row=0, column=1, padx=5, sticky="ew")
+        )
+        self.batch_btn.grid(row=0, column=1, padx=5, sticky="ew")
 
         log_frame = ttk.Labelframe(main_frame, text="Activity Log")
         log_frame.pack(fill=BOTH, expand=True, pady=10)
@@ -430,6 +739,10 @@ class PDFMergerApp:
             self.observer.stop()
             self.observer.join()
             self.observer = None
+            if self.watch_handler:
+                self.watch_handler.stop()
+                self.watch_handler = None
+            self._stop_merge_server()
             self.watch_btn.config(text="▶ Start Watching", style="Accent.TButton")
             log_message(self.log_text, "[~] Folder watching stopped.")
         else:
@@ -439,7 +752,9 @@ class PDFMergerApp:
                     "Please select both a Letterhead PDF and a Watch Folder first.",
                 )
                 return
-            handler = InvoiceHandler(self, Path(self.letterhead_path.get()))
+            self._start_merge_server()
+            handler = InvoiceHandler(self)
+            self.watch_handler = handler
             self.observer = Observer()
             self.observer.schedule(
                 handler, path=self.watch_folder.get(), recursive=False
@@ -458,7 +773,11 @@ class PDFMergerApp:
         if path:
             self.letterhead_path.set(path)
             config["letterhead_path"] = path
-            save_config(config)
+            self._schedule_config_save()
+            if self._merger and self._merger.is_alive():
+                # The worker holds the old letterhead; restart it on the new one.
+                self._stop_merge_server()
+                self._start_merge_server()
             self.update_status()
 
     def select_folder(self):
@@ -466,10 +785,17 @@ class PDFMergerApp:
         if path:
             self.watch_folder.set(path)
             config["watch_folder"] = path
-            save_config(config)
+            self._schedule_config_save()
             if self.observer and self.observer.is_alive():
-                self.toggle_watch()
-                self.toggle_watch()
+                # Re-point the running observer at the new folder rather than
+                # tearing down and restarting the whole observer thread.
+                self.observer.unschedule_all()
+                if self.watch_handler:
+                    self.watch_handler.stop()
+                handler = InvoiceHandler(self)
+                self.watch_handler = handler
+                self.observer.schedule(handler, path=path, recursive=False)
+                log_message(self.log_text, f"[+] Now watching folder: {path}")
             self.update_status()
 
     def manual_merge(self):
@@ -488,9 +814,30 @@ class PDFMergerApp:
         )
         if not output_pdf:
             return
-        merge_letterhead(
-            self, Path(input_pdf), Path(self.letterhead_path.get()), Path(output_pdf)
-        )
+        letterhead_path = self.letterhead_path.get()
+
+        # Merge off the main thread so large PDFs don't freeze the UI. The
+        # thread opens its own letterhead: pikepdf.Pdf objects aren't safe to
+        # share across threads, and a merge must not stamp from a Pdf the
+        # main thread could close behind it.
+        def _merge():
+            try:
+                with pikepdf.open(letterhead_path) as letterhead:
+                    if len(letterhead.pages) != 1:
+                        raise ValueError("Letterhead PDF must have exactly one page.")
+                    merge_letterhead(
+                        self, Path(input_pdf), letterhead.pages[0], Path(output_pdf)
+                    )
+            except Exception as e:
+                err = str(e)
+                self.root.after(
+                    0,
+                    lambda: messagebox.showerror(
+                        "Merge Error", f"Could not load letterhead: {err}"
+                    ),
+                )
+
+        threading.Thread(target=_merge, daemon=True).start()
 
     def batch_merge(self):
         if not self.letterhead_path.get():
@@ -504,17 +851,40 @@ class PDFMergerApp:
         output_folder = filedialog.askdirectory(title="Select Output Folder")
         if not output_folder:
             return
+        letterhead_path = self.letterhead_path.get()
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        futures = []
         for file_path in files:
             file = Path(file_path)
             out_path = Path(output_folder) / file.with_suffix(".merged.pdf").name
-            merge_letterhead(self, file, Path(self.letterhead_path.get()), out_path)
+            futures.append(
+                executor.submit(_merge_worker, str(file), letterhead_path, str(out_path))
+            )
+        self.batch_btn.config(state="disabled")
+        log_message(self.log_text, f"[+] Batch merging {len(futures)} file(s)...")
+        self.root.after(100, self._poll_batch_futures, executor, futures)
+
+    def _poll_batch_futures(self, executor, futures):
+        """Drain finished batch-merge futures into the log without blocking Tk."""
+        remaining = []
+        for future in futures:
+            if not future.done():
+                remaining.append(future)
+                continue
+            try:
+                ok, msg = future.result()
+            except Exception as e:
+                ok, msg = False, f"Merge worker crashed: {e}"
+            log_message(self.log_text, f"[✓] {msg}" if ok else f"[✗] {msg}")
+        if remaining:
+            self.root.after(100, self._poll_batch_futures, executor, remaining)
+        else:
+            executor.shutdown(wait=False)
+            self.batch_btn.config(state="normal")
+            log_message(self.log_text, "[+] Batch merge finished.")
 
     def get_tray_image(self):
-        try:
-            return Image.open(ICON_PATH)
-        except Exception as e:
-            print(f"[!] Could not load tray icon from {ICON_PATH}: {e}")
-            return Image.new("RGB", (64, 64), "white")
+        return self._tray_image
 
     def minimize_to_tray(self):
         self.root.withdraw()
@@ -546,6 +916,11 @@ class PDFMergerApp:
         if self.observer:
             self.observer.stop()
             self.observer.join()
+        if self.watch_handler:
+            self.watch_handler.stop()
+        self._stop_merge_server()
+        # Don't lose a pending debounced config write on exit.
+        self._flush_config()
         self.root.quit()
 
     def check_for_updates(self):
@@ -555,11 +930,29 @@ class PDFMergerApp:
         if GITHUB_REPO == "YOUR_USERNAME/YOUR_REPONAME":
             print("[!] GITHUB_REPO not set. Skipping update check.")
             return
+        # Warm starts skip the GitHub round trip entirely: the latest-release
+        # JSON is cached next to the config file for an hour.
+        cache_path = CONFIG_FILE.with_suffix(".update-cache.json")
+        latest_release = None
+        try:
+            if (
+                cache_path.exists()
+                and time.time() - cache_path.stat().st_mtime < 3600
+            ):
+                with open(cache_path, "r") as f:
+                    latest_release = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            latest_release = None
         try:
-            api_url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-            response = requests.get(api_url, timeout=5)
-            response.raise_for_status()
-            latest_release = response.json()
+            if latest_release is None:
+                api_url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+                response = requests.get(api_url, timeout=5)
+                response.raise_for_status()
+                latest_release = response.json()
+                tmp_path = cache_path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(latest_release, f)
+                os.replace(tmp_path, cache_path)
             latest_version_str = latest_release["tag_name"].lstrip("v")
 
             if parse_version(latest_version_str) > parse_version(__version__):
@@ -605,11 +998,21 @@ class PDFMergerApp:
                 total_size = int(response.headers.get("content-length", 0))
                 progress["maximum"] = total_size
 
-                with open(new_exe_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                # Large chunks keep syscall count low; the progress bar is
+                # refreshed at most ~20x/s so Tk redraws don't dominate the
+                # download.
+                written = 0
+                last_tick = 0.0
+                with open(new_exe_path, "wb", buffering=1024 * 1024) as f:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
                         f.write(chunk)
-                        progress["value"] += len(chunk)
-                        update_window.update_idletasks()
+                        written += len(chunk)
+                        now = time.monotonic()
+                        if now - last_tick > 0.05:
+                            last_tick = now
+                            progress["value"] = written
+                            update_window.update_idletasks()
+                progress["value"] = written
 
                 current_exe = sys.executable
                 with open(updater_script_path, "w") as f:
@@ -628,14 +1031,24 @@ class PDFMergerApp:
                 self.root.after(100, self.exit_app)
 
             except Exception as e:
-                messagebox.showerror("Update Failed", f"Could not download update: {e}")
-                update_window.destroy()
+                err = str(e)
+
+                def _report_failure():
+                    messagebox.showerror(
+                        "Update Failed", f"Could not download update: {err}"
+                    )
+                    update_window.destroy()
+
+                self.root.after(0, _report_failure)
 
         threading.Thread(target=_download, daemon=True).start()
 
 
 # ───── APPLICATION ENTRY POINT ─────
 if __name__ == "__main__":
+    # Required for ProcessPoolExecutor workers in the PyInstaller build.
+    multiprocessing.freeze_support()
+
     # We must keep a reference to the mutex, otherwise it's released
     mutex = None
     if SINGLE_INSTANCE_SUPPORT: